@@ -5,6 +5,8 @@ FastAPIベースのWebhookレシーバーと、Slack Botとの統合サンプル
 ELのイベントをリアルタイムで受信し、Slackに通知します。
 """
 
+import asyncio
+
 from fastapi import FastAPI, Request
 from el_sdk import ELClient
 
@@ -66,11 +68,13 @@ async def handle_session_completed(data: dict):
 async def start_session(request: Request):
     """外部チャットボットからセッションを開始"""
     body = await request.json()
-    session = el.create_session(
+    # SDKは同期I/Oのため、イベントループを塞がないようスレッドで実行する
+    session = await asyncio.to_thread(
+        el.create_session,
         topic=body.get("topic", "新規セッション"),
         description=body.get("description", ""),
     )
-    question = session.get_next_question()
+    question = await asyncio.to_thread(session.get_next_question)
     return {
         "session_id": session.id,
         "first_question": question.text if question else None,
@@ -81,14 +85,15 @@ async def start_session(request: Request):
 async def respond_to_question(request: Request):
     """ユーザーの回答を処理し、次の質問を返す"""
     body = await request.json()
-    session = el.get_session(body["session_id"])
+    session = await asyncio.to_thread(el.get_session, body["session_id"])
 
-    result = session.respond(
+    result = await asyncio.to_thread(
+        session.respond,
         question_id=body["question_id"],
         response_text=body["response_text"],
     )
 
-    next_question = session.get_next_question()
+    next_question = await asyncio.to_thread(session.get_next_question)
 
     return {
         "facts_extracted": result["facts_extracted"],
@@ -105,8 +110,8 @@ async def respond_to_question(request: Request):
 async def get_summary(request: Request):
     """セッションのサマリーを取得"""
     body = await request.json()
-    session = el.get_session(body["session_id"])
-    summary = session.get_summary()
+    session = await asyncio.to_thread(el.get_session, body["session_id"])
+    summary = await asyncio.to_thread(session.get_summary)
 
     return {
         "total_facts": summary.total_facts,
@@ -6,6 +6,7 @@ EL ドキュメント取り込み例
 """
 
 import time
+from collections import Counter
 
 from el_sdk import ELClient
 
@@ -62,13 +63,10 @@ def main():
     print(f"📊 抽出されたファクト: {len(facts)}件")
 
     # カテゴリ別に集計
-    categories = {}
-    for fact in facts:
-        cat = fact.category
-        categories[cat] = categories.get(cat, 0) + 1
+    categories = Counter(fact.category for fact in facts)
 
     print("\nカテゴリ別内訳:")
-    for cat, count in sorted(categories.items(), key=lambda x: -x[1]):
+    for cat, count in categories.most_common():
         print(f"  {cat}: {count}件")
 
     # サマリーを確認
@@ -152,10 +152,11 @@ class ELClient:
         url = f"{self.base_url}/api/v1{path}"
 
         if "files" in kwargs:
-            headers = {"Authorization": f"Bearer {self.api_key}"}
-            resp = requests.request(method, url, headers=headers, timeout=self.timeout, **kwargs)
-        else:
-            resp = self._session.request(method, url, timeout=self.timeout, **kwargs)
+            # multipartのboundaryはrequestsに付与させるため、セッション既定のContent-Typeを外す
+            # （Noneを指定したヘッダーはマージ時に削除される）
+            kwargs["headers"] = {"Content-Type": None}
+
+        resp = self._session.request(method, url, timeout=self.timeout, **kwargs)
 
         resp.raise_for_status()
 